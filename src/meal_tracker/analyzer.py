@@ -1,55 +1,63 @@
 """食事記録の傾向分析"""
 
+import bisect
 from typing import List, Dict, Tuple
 from collections import Counter
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime, timedelta
 
 from .models import Meal
 
 
 class MealAnalyzer:
-    """食事記録を分析するクラス"""
+    """食事記録を分析するクラス
+
+    meals は日時の昇順に並んでいることを前提とする
+    （MealStorage.load_all_meals の戻り値はこの順序）。
+    """
+
+    # 栄養バランスの推定に使うタグと理想的な出現割合
+    NUTRITION_TAGS = (
+        ('ヘルシー', 0.3),
+        ('高タンパク', 0.25),
+        ('野菜多め', 0.4),
+        ('低カロリー', 0.2)
+    )
 
     def __init__(self, meals: List[Meal]):
         self.meals = meals
+        # 期間での絞り込みを二分探索で行うための日時リスト
+        self._dt_keys = [meal._dt for meal in meals]
+
+        # 各種集計は最初にまとめて作成しておく
+        # （map/chain/Counter はいずれも C 実装なので、Python のループを介さずに数える）
+        self._items = Counter(chain.from_iterable(map(attrgetter('menu_items'), meals)))
+        self._cats = Counter(chain.from_iterable(map(attrgetter('categories'), meals)))
+        self._types = Counter(map(attrgetter('meal_type'), meals))
+        self._tags = Counter(chain.from_iterable(map(attrgetter('tags'), meals)))
+        # 過去に登場した全カテゴリー
+        self._all_categories = frozenset(self._cats)
 
     def get_favorite_items(self, limit: int = 10) -> List[Tuple[str, int]]:
         """よく食べるメニュー項目を取得"""
-        all_items = []
-        for meal in self.meals:
-            all_items.extend(meal.menu_items)
-
-        item_counter = Counter(all_items)
-        return item_counter.most_common(limit)
+        return self._items.most_common(limit)
 
     def get_category_distribution(self) -> Dict[str, int]:
         """カテゴリー別の食事回数を取得"""
-        all_categories = []
-        for meal in self.meals:
-            all_categories.extend(meal.categories)
-
-        return dict(Counter(all_categories))
+        return dict(self._cats)
 
     def get_meal_type_distribution(self) -> Dict[str, int]:
         """食事タイプ別の回数を取得"""
-        meal_types = [meal.meal_type for meal in self.meals]
-        return dict(Counter(meal_types))
+        return dict(self._types)
 
     def get_tag_frequency(self) -> Dict[str, int]:
         """タグの頻度を取得"""
-        all_tags = []
-        for meal in self.meals:
-            all_tags.extend(meal.tags)
-
-        return dict(Counter(all_tags))
+        return dict(self._tags)
 
     def get_recent_trends(self, days: int = 7) -> Dict[str, any]:
         """最近N日間の傾向を分析"""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        recent_meals = [
-            meal for meal in self.meals
-            if datetime.fromisoformat(meal.datetime) >= cutoff_date
-        ]
+        recent_meals = self._meals_since(days)
 
         if not recent_meals:
             return {
@@ -67,63 +75,49 @@ class MealAnalyzer:
             "tags": analyzer.get_tag_frequency()
         }
 
+    def _meals_since(self, days: int) -> List[Meal]:
+        """最近N日間の食事記録を取得"""
+        cutoff_date = datetime.now() - timedelta(days=days)
+        index = bisect.bisect_left(self._dt_keys, cutoff_date)
+        return self.meals[index:]
+
     def get_variety_score(self) -> float:
         """食事の多様性スコアを計算（0.0-1.0）"""
-        if not self.meals:
-            return 0.0
-
-        all_items = []
-        for meal in self.meals:
-            all_items.extend(meal.menu_items)
-
-        unique_items = len(set(all_items))
-        total_items = len(all_items)
-
+        total_items = self._items.total()
         if total_items == 0:
             return 0.0
 
         # 多様性スコア = ユニークアイテム数 / 総アイテム数
-        return unique_items / total_items
+        return len(self._items) / total_items
 
     def get_missing_categories(self, recent_days: int = 7) -> List[str]:
         """最近不足しているカテゴリーを特定"""
-        # 過去の全カテゴリーを取得
-        all_categories = set()
-        for meal in self.meals:
-            all_categories.update(meal.categories)
-
-        # 最近のカテゴリーを取得
-        cutoff_date = datetime.now() - timedelta(days=recent_days)
-        recent_categories = set()
-        for meal in self.meals:
-            if datetime.fromisoformat(meal.datetime) >= cutoff_date:
-                recent_categories.update(meal.categories)
+        # 最近のカテゴリーを取得（過去の全カテゴリーは __init__ で集計済み）
+        recent_categories = set().union(
+            *(meal.categories for meal in self._meals_since(recent_days))
+        )
 
         # 不足しているカテゴリー
-        missing = all_categories - recent_categories
+        missing = self._all_categories - recent_categories
         return list(missing)
 
     def get_nutrition_balance_status(self) -> Dict[str, str]:
         """栄養バランスの状態を推定（タグベース）"""
         recent_meals = self.meals[-14:] if len(self.meals) >= 14 else self.meals
-        tag_freq = {}
 
-        for meal in recent_meals:
-            for tag in meal.tags:
-                tag_freq[tag] = tag_freq.get(tag, 0) + 1
+        if len(recent_meals) == len(self.meals):
+            # 全件が対象なら __init__ で集計済みのタグ頻度をそのまま使う
+            tag_freq = self._tags
+        else:
+            tag_freq = Counter()
+            for meal in recent_meals:
+                tag_freq.update(meal.tags)
 
         total_meals = len(recent_meals)
         balance_status = {}
 
         # タグの頻度から栄養バランスを推定
-        nutrition_tags = {
-            'ヘルシー': 0.3,
-            '高タンパク': 0.25,
-            '野菜多め': 0.4,
-            '低カロリー': 0.2
-        }
-
-        for tag, ideal_ratio in nutrition_tags.items():
+        for tag, ideal_ratio in self.NUTRITION_TAGS:
             if tag in tag_freq:
                 actual_ratio = tag_freq[tag] / total_meals
                 if actual_ratio >= ideal_ratio:
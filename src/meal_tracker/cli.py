@@ -5,8 +5,6 @@ from typing import List
 
 from .storage import MealStorage
 from .models import Meal
-from .analyzer import MealAnalyzer
-from .recommender import MealRecommender
 
 
 class MealTrackerCLI:
@@ -100,6 +98,9 @@ class MealTrackerCLI:
 
     def analyze_trends(self):
         """傾向を分析"""
+        # 起動時間を短くするため、分析機能は使うときに読み込む
+        from .analyzer import MealAnalyzer
+
         print("\n=== 食事傾向の分析 ===")
 
         meals = self.storage.load_all_meals()
@@ -137,6 +138,8 @@ class MealTrackerCLI:
 
     def recommend_meal(self):
         """メニューを提案"""
+        from .recommender import MealRecommender
+
         print("\n=== 次の食事メニュー提案 ===")
 
         meals = self.storage.load_all_meals()
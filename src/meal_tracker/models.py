@@ -1,11 +1,12 @@
 """食事記録のデータモデル"""
 
+from sys import intern
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 
 
-@dataclass
+@dataclass(slots=True)
 class Meal:
     """食事記録を表すデータクラス"""
 
@@ -17,15 +18,55 @@ class Meal:
     tags: List[str]  # タグ（ヘルシー、高タンパクなど）
     calories: Optional[int] = None
     notes: Optional[str] = None
+    # datetime を解析済みの値（分析時に毎回 fromisoformat しないためのキャッシュ）
+    # 生成時にのみ計算されるため、datetime を変更した場合は copy() で作り直す
+    _dt: datetime = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._dt = datetime.fromisoformat(self.datetime)
+
+    def copy(self) -> 'Meal':
+        """複製を作成（リストも複製し、_dt は datetime から計算し直す）"""
+        return Meal(
+            self.id,
+            self.datetime,
+            self.meal_type,
+            list(self.menu_items),
+            list(self.categories),
+            list(self.tags),
+            self.calories,
+            self.notes
+        )
 
     def to_dict(self) -> Dict:
         """辞書形式に変換"""
-        return asdict(self)
+        # asdict は再帰的にディープコピーするため、フラットな Meal では手書きで組み立てる
+        return {
+            "id": self.id,
+            "datetime": self.datetime,
+            "meal_type": self.meal_type,
+            "menu_items": self.menu_items,
+            "categories": self.categories,
+            "tags": self.tags,
+            "calories": self.calories,
+            "notes": self.notes
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Meal':
         """辞書から Meal オブジェクトを生成"""
-        return cls(**data)
+        # キーワード引数の展開を避けて位置引数で生成する
+        # 同じメニュー名・カテゴリー名・タグが何度も現れるため、文字列をインターンして共有する
+        return cls(
+            data["id"],
+            data["datetime"],
+            data["meal_type"],
+            [intern(item) for item in data["menu_items"]],
+            [intern(category) for category in data["categories"]],
+            [intern(tag) for tag in data["tags"]],
+            data.get("calories"),
+            data.get("notes")
+        )
 
     @classmethod
     def create_new(
@@ -52,7 +93,7 @@ class Meal:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MealRecommendation:
     """メニュー提案を表すデータクラス"""
 
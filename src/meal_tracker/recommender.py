@@ -1,7 +1,8 @@
 """食事メニューの提案エンジン"""
 
 import random
-from typing import List, Dict
+from itertools import islice
+from typing import List, Dict, Tuple
 from datetime import datetime, timedelta
 
 from .models import Meal, MealRecommendation
@@ -37,18 +38,28 @@ class MealRecommender:
 
     def __init__(self, meals: List[Meal]):
         self.meals = meals
+        # モジュール共通の乱数生成器ではなくインスタンスごとのものを使う
+        self._rng = random.Random()
         self.analyzer = MealAnalyzer(meals)
 
+        # 分析結果は meals が変わらない限り同じなので、提案のたびに再計算しない
+        self._favorite_items = dict(self.analyzer.get_favorite_items())
+        self._category_dist = self.analyzer.get_category_distribution()
+        self._missing_categories = self.analyzer.get_missing_categories(recent_days=7)
+        self._nutrition_balance = self.analyzer.get_nutrition_balance_status()
+        # 最近10件に含まれるメニュー
+        self._recent_items = set().union(*(meal.menu_items for meal in meals[-10:]))
+
     def recommend_next_meal(self, meal_type: str = "lunch") -> MealRecommendation:
         """次の食事メニューを提案"""
         if not self.meals:
             return self._generate_default_recommendation(meal_type)
 
-        # 傾向分析
-        favorite_items = dict(self.analyzer.get_favorite_items())
-        category_dist = self.analyzer.get_category_distribution()
-        missing_categories = self.analyzer.get_missing_categories(recent_days=7)
-        nutrition_balance = self.analyzer.get_nutrition_balance_status()
+        # 傾向分析（__init__ で計算済み）
+        favorite_items = self._favorite_items
+        category_dist = self._category_dist
+        missing_categories = self._missing_categories
+        nutrition_balance = self._nutrition_balance
 
         # 提案戦略を決定
         recommended_category = self._select_recommended_category(
@@ -79,6 +90,19 @@ class MealRecommender:
             confidence_score=confidence
         )
 
+    def recommend_items_only(self, meal_type: str = "lunch") -> Tuple[List[str], str]:
+        """提案メニューとカテゴリーのみを取得（理由やアドバイスは生成しない）"""
+        if not self.meals:
+            return self._select_default_items()
+
+        recommended_category = self._select_recommended_category(
+            self._category_dist, self._missing_categories
+        )
+        recommended_items = self._select_menu_items(
+            recommended_category, self._favorite_items
+        )
+        return recommended_items, recommended_category
+
     def _select_recommended_category(
         self, category_dist: Dict[str, int], missing_categories: List[str]
     ) -> str:
@@ -86,7 +110,7 @@ class MealRecommender:
         # 不足しているカテゴリーを優先
         if missing_categories:
             # ランダムに不足カテゴリーから選択
-            return random.choice(missing_categories)
+            return self._rng.choice(missing_categories)
 
         # 最も少ないカテゴリーを選択（バランスを取る）
         if category_dist:
@@ -94,7 +118,7 @@ class MealRecommender:
             return sorted_categories[0][0]
 
         # デフォルト
-        return random.choice(list(self.MENU_DATABASE.keys()))
+        return self._rng.choice(list(self.MENU_DATABASE.keys()))
 
     def _select_menu_items(
         self, category: str, favorite_items: Dict[str, int]
@@ -105,13 +129,11 @@ class MealRecommender:
         if not available_items:
             # カテゴリーがマスターにない場合、過去のアイテムから提案
             if favorite_items:
-                return list(favorite_items.keys())[:3]
+                return list(islice(favorite_items.keys(), 3))
             return ["おすすめメニュー"]
 
         # 最近食べていないアイテムを優先
-        recent_items = set()
-        for meal in self.meals[-10:]:  # 最近10件
-            recent_items.update(meal.menu_items)
+        recent_items = self._recent_items
 
         # まだ食べていないアイテムを探す
         unused_items = [item for item in available_items if item not in recent_items]
@@ -119,11 +141,11 @@ class MealRecommender:
         if unused_items:
             # ランダムに2-3個選択
             count = min(3, len(unused_items))
-            return random.sample(unused_items, count)
+            return self._rng.sample(unused_items, count)
         else:
             # 全て食べている場合はランダム選択
             count = min(3, len(available_items))
-            return random.sample(available_items, count)
+            return self._rng.sample(available_items, count)
 
     def _generate_reason(
         self,
@@ -183,8 +205,7 @@ class MealRecommender:
 
     def _generate_default_recommendation(self, meal_type: str) -> MealRecommendation:
         """デフォルトの提案（データがない場合）"""
-        category = random.choice(list(self.MENU_DATABASE.keys()))
-        items = random.sample(self.MENU_DATABASE[category], 2)
+        items, category = self._select_default_items()
 
         return MealRecommendation(
             recommended_items=items,
@@ -197,6 +218,12 @@ class MealRecommender:
             confidence_score=0.3
         )
 
+    def _select_default_items(self) -> Tuple[List[str], str]:
+        """データがない場合のメニューとカテゴリーを選択"""
+        category = self._rng.choice(list(self.MENU_DATABASE.keys()))
+        items = self._rng.sample(self.MENU_DATABASE[category], 2)
+        return items, category
+
     def get_weekly_meal_plan(self) -> Dict[str, List[str]]:
         """1週間分の食事プランを提案"""
         meal_types = ["breakfast", "lunch", "dinner"]
@@ -205,11 +232,12 @@ class MealRecommender:
         for day in range(1, 8):
             day_plan = []
             for meal_type in meal_types:
-                recommendation = self.recommend_next_meal(meal_type)
+                # 一括作成では理由やアドバイスは使わないため、メニューのみを選択する
+                items, category = self.recommend_items_only(meal_type)
                 day_plan.append({
                     "meal_type": meal_type,
-                    "items": recommendation.recommended_items,
-                    "category": recommendation.categories[0]
+                    "items": items,
+                    "category": category
                 })
             weekly_plan[f"Day {day}"] = day_plan
 
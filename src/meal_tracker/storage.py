@@ -2,17 +2,72 @@
 
 import json
 import os
-from typing import List, Optional
+from typing import List, Dict, Optional
 from pathlib import Path
 
 from .models import Meal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _loads(raw: bytes):
+    """JSONをデコード（orjsonがあれば優先して使用）"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    """JSONをエンコード（orjsonがあれば優先して使用）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _dumps_line(data) -> bytes:
+    """JSON Lines の1行分をエンコード"""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def _sort_key(meal: Meal):
+    """食事記録を日時の昇順に並べるためのキー
+
+    ISO 8601 の文字列はそのまま比較できるため、解析済みの _dt は使わない
+    （タイムゾーンの有無が混在しても比較でエラーにならない）。
+    """
+    return meal.datetime
+
 
 class MealStorage:
-    """食事記録をJSONファイルで管理するクラス"""
+    """食事記録をJSONファイルで管理するクラス
+
+    新規の記録は JSON Lines 形式の追記ファイル（meals.jsonl）に書き込み、
+    一定サイズを超えたら meals.json に統合する。
+    """
+
+    # 追記ファイルがこのサイズ（バイト）を超えたら meals.json に統合する
+    COMPACT_THRESHOLD = 1024 * 1024
+    # meals.json がこのサイズ（バイト）を超えたら ijson で逐次読み込みする
+    STREAMING_THRESHOLD = 4 * 1024 * 1024
 
     def __init__(self, data_file: str = "data/meals.json"):
         self.data_file = Path(data_file)
+        self.log_file = self.data_file.with_suffix(".jsonl")
+        # 読み込み結果のキャッシュ（ファイルの mtime とサイズで無効化）
+        self._cache: Optional[List[Meal]] = None
+        self._cache_key: Optional[tuple] = None
+        # キャッシュ内の食事記録を ID で引くための索引
+        self._by_id: Dict[str, Meal] = {}
         self._ensure_data_directory()
 
     def _ensure_data_directory(self):
@@ -20,53 +75,177 @@ class MealStorage:
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
         if not self.data_file.exists():
             self.data_file.write_text("[]")
+        if not self.log_file.exists():
+            self.log_file.touch()
 
     def save_meal(self, meal: Meal) -> bool:
         """食事記録を保存"""
         try:
-            meals = self.load_all_meals()
-            meals.append(meal)
-            self._write_meals(meals)
-            return True
+            # 追記のために全件を読み込むことはしない
+            # （キャッシュが最新の場合のみ、追記分をキャッシュにも反映する）
+            cache_is_fresh = (
+                self._cache is not None and self._cache_key == self._stat_key()
+            )
+            line = _dumps_line(meal.to_dict())
+            with open(self.log_file, 'a+b') as f:
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.seek(0)
+                        raw = f.read()
+                        start = raw.rfind(b"\n") + 1
+                        try:
+                            # 改行だけが欠けた完全な行は残し、改行で区切ってから追記する
+                            _loads(raw[start:])
+                            line = b"\n" + line
+                        except ValueError:
+                            # 書き込み途中で中断された末尾の行は切り詰める
+                            f.truncate(start)
+                f.write(line)
+
+            if cache_is_fresh:
+                # 呼び出し側での変更がキャッシュに混ざらないよう複製を保持する
+                cached = meal.copy()
+                self._cache.append(cached)
+                self._by_id[cached.id] = cached
+                if len(self._cache) > 1 and cached.datetime < self._cache[-2].datetime:
+                    self._cache.sort(key=_sort_key)
+                self._cache_key = self._stat_key()
+            else:
+                self._invalidate_cache()
         except Exception as e:
+            self._invalidate_cache()
             print(f"Error saving meal: {e}")
             return False
 
+        # 追記は完了しているので、統合に失敗しても保存自体は成功とする
+        try:
+            if self.log_file.stat().st_size > self.COMPACT_THRESHOLD:
+                self.compact()
+        except Exception as e:
+            print(f"Error compacting meals: {e}")
+        return True
+
     def load_all_meals(self) -> List[Meal]:
-        """全ての食事記録を読み込み"""
+        """全ての食事記録を読み込み（日時の昇順）
+
+        返される Meal はキャッシュと共有しているため変更しないこと。
+        変更する場合は get_meal_by_id で取得した複製を update_meal に渡す。
+        """
+        return list(self._load_cached())
+
+    def _load_cached(self) -> List[Meal]:
+        """キャッシュ済みの食事記録を取得（ファイルが変更された場合のみ再読み込み）"""
+        try:
+            key = self._stat_key()
+            if key != self._cache_key:
+                meals = self._read_base()
+                # meals.json の書き込み後、追記ファイルを空にする前に中断された場合は
+                # 同じ記録が両方に残るため、meals.json 側を優先する
+                base_ids = {meal.id for meal in meals}
+                meals += [meal for meal in self._read_log() if meal.id not in base_ids]
+                meals.sort(key=_sort_key)
+                self._set_cache(meals, key)
+            return self._cache
+        except FileNotFoundError:
+            self._invalidate_cache()
+            return []
+
+    def _read_base(self) -> List[Meal]:
+        """meals.json から食事記録を読み込み"""
+        size = self.data_file.stat().st_size
+        if ijson is not None and size > self.STREAMING_THRESHOLD:
+            return self._stream_base()
+
+        # 壊れたファイルを空として扱うと次の書き込みで全履歴を失うため、エラーは送出する
+        data = _loads(self.data_file.read_bytes())
+        return [Meal.from_dict(meal_data) for meal_data in data]
+
+    def _stream_base(self) -> List[Meal]:
+        """meals.json を ijson で1件ずつ読み込み（全体のパース結果を保持しない）"""
+        meals = []
+        with open(self.data_file, 'rb') as f:
+            items = ijson.items(f, 'item', use_float=True)
+            while True:
+                try:
+                    meal_data = next(items)
+                except StopIteration:
+                    break
+                except ijson.JSONError as e:
+                    # 通常の読み込み（JSONDecodeError）と同じく ValueError として送出する
+                    raise ValueError(f"Invalid JSON in {self.data_file}: {e}") from e
+                meals.append(Meal.from_dict(meal_data))
+        return meals
+
+    def _read_log(self) -> List[Meal]:
+        """追記ファイル（meals.jsonl）から食事記録を読み込み"""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [Meal.from_dict(meal_data) for meal_data in data]
-        except (FileNotFoundError, json.JSONDecodeError):
+            raw = self.log_file.read_bytes()
+        except FileNotFoundError:
             return []
 
+        lines = [line for line in raw.splitlines() if line.strip()]
+        meals = []
+        for i, line in enumerate(lines):
+            try:
+                meal_data = _loads(line)
+            except ValueError:
+                # 書き込み途中で中断された末尾の行のみ読み飛ばす
+                if i == len(lines) - 1:
+                    break
+                raise
+            meals.append(Meal.from_dict(meal_data))
+        return meals
+
+    def _stat_key(self) -> tuple:
+        """キャッシュの有効性を判定するキーを取得"""
+        st = self.data_file.stat()
+        try:
+            log_st = self.log_file.stat()
+            log_key = (log_st.st_mtime_ns, log_st.st_size)
+        except FileNotFoundError:
+            log_key = None
+        return (st.st_mtime_ns, st.st_size, log_key)
+
+    def _set_cache(self, meals: List[Meal], key: tuple):
+        """キャッシュと ID 索引を更新"""
+        self._cache = meals
+        self._cache_key = key
+        self._by_id = {meal.id: meal for meal in meals}
+
+    def _invalidate_cache(self):
+        """キャッシュを破棄"""
+        self._cache = None
+        self._cache_key = None
+        self._by_id = {}
+
     def get_meal_by_id(self, meal_id: str) -> Optional[Meal]:
-        """IDで食事記録を検索"""
-        meals = self.load_all_meals()
-        for meal in meals:
-            if meal.id == meal_id:
-                return meal
-        return None
+        """IDで食事記録を検索（キャッシュとは独立した複製を返す）"""
+        self._load_cached()
+        meal = self._by_id.get(meal_id)
+        return meal.copy() if meal is not None else None
 
     def get_recent_meals(self, limit: int = 10) -> List[Meal]:
         """最近の食事記録を取得"""
-        meals = self.load_all_meals()
-        # datetimeでソート（新しい順）
-        sorted_meals = sorted(meals, key=lambda m: m.datetime, reverse=True)
-        return sorted_meals[:limit]
+        meals = self._load_cached()
+        # キャッシュは日時の昇順なので末尾から取り出す（新しい順）
+        return [meal.copy() for meal in reversed(meals[max(len(meals) - limit, 0):])]
 
     def get_meals_by_type(self, meal_type: str) -> List[Meal]:
         """食事タイプで絞り込み"""
-        meals = self.load_all_meals()
-        return [meal for meal in meals if meal.meal_type == meal_type]
+        meals = self._load_cached()
+        return [meal.copy() for meal in meals if meal.meal_type == meal_type]
 
     def update_meal(self, meal: Meal) -> bool:
         """食事記録を更新"""
         try:
-            meals = self.load_all_meals()
-            updated_meals = [meal if m.id == meal.id else m for m in meals]
-            self._write_meals(updated_meals)
+            self._load_cached()
+            current = self._by_id.get(meal.id)
+            if current is not None:
+                # 呼び出し側で datetime が変更されていても _dt が正しくなるよう作り直す
+                updated = meal.copy()
+                updated_meals = [updated if m is current else m for m in self._cache]
+                self._write_meals(updated_meals)
             return True
         except Exception as e:
             print(f"Error updating meal: {e}")
@@ -75,9 +254,11 @@ class MealStorage:
     def delete_meal(self, meal_id: str) -> bool:
         """食事記録を削除"""
         try:
-            meals = self.load_all_meals()
-            filtered_meals = [m for m in meals if m.id != meal_id]
-            self._write_meals(filtered_meals)
+            self._load_cached()
+            target = self._by_id.get(meal_id)
+            if target is not None:
+                filtered_meals = [m for m in self._cache if m is not target]
+                self._write_meals(filtered_meals)
             return True
         except Exception as e:
             print(f"Error deleting meal: {e}")
@@ -85,10 +266,23 @@ class MealStorage:
 
     def _write_meals(self, meals: List[Meal]):
         """食事記録をファイルに書き込み"""
-        with open(self.data_file, 'w', encoding='utf-8') as f:
+        try:
             data = [meal.to_dict() for meal in meals]
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            # 書き込み途中で中断されても既存のファイルが壊れないよう、一時ファイル経由で置き換える
+            tmp_file = self.data_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(_dumps(data))
+            os.replace(tmp_file, self.data_file)
+            # 全件を書き込んだので追記ファイルは空にする
+            self.log_file.write_bytes(b"")
+            self._set_cache(sorted(meals, key=_sort_key), self._stat_key())
+        except Exception:
+            self._invalidate_cache()
+            raise
+
+    def compact(self):
+        """追記ファイルの内容を meals.json に統合"""
+        self._write_meals(self._load_cached())
 
     def get_total_count(self) -> int:
         """記録された食事の総数を取得"""
-        return len(self.load_all_meals())
+        return len(self._load_cached())
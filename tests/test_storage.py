@@ -0,0 +1,197 @@
+"""MealStorage のテスト"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from meal_tracker import storage
+from meal_tracker.models import Meal
+from meal_tracker.storage import MealStorage
+
+
+def make_meal(meal_id: str, dt: str = "2025-10-28T12:00:00") -> Meal:
+    """テスト用の食事記録を作成"""
+    return Meal.from_dict({
+        "id": meal_id,
+        "datetime": dt,
+        "meal_type": "lunch",
+        "menu_items": ["ご飯", "味噌汁"],
+        "categories": ["和食"],
+        "tags": ["ヘルシー"],
+        "calories": 650,
+        "notes": None
+    })
+
+
+class MealStorageTest(unittest.TestCase):
+    """食事記録の保存・読み込みのテスト"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_file = Path(self.tmp_dir.name) / "meals.json"
+        self.storage = MealStorage(str(self.data_file))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def reload(self) -> MealStorage:
+        """キャッシュを持たない新しいインスタンスで開き直す"""
+        return MealStorage(str(self.data_file))
+
+    def test_save_appends_to_log_and_reloads(self):
+        for i in range(3):
+            self.assertTrue(self.storage.save_meal(make_meal(f"m{i}", f"2025-10-2{i}T12:00:00")))
+
+        self.assertEqual(self.data_file.read_text(), "[]")
+        self.assertEqual(len(self.storage.log_file.read_bytes().splitlines()), 3)
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m0", "m1", "m2"])
+
+    def test_save_does_not_read_history(self):
+        self.storage.save_meal(make_meal("m0"))
+        self.storage.compact()
+
+        fresh = self.reload()
+        with mock.patch.object(fresh, "_read_base", side_effect=AssertionError):
+            self.assertTrue(fresh.save_meal(make_meal("m1")))
+        self.assertEqual(self.reload().get_total_count(), 2)
+
+    def test_compact_merges_log_into_json(self):
+        for i in range(3):
+            self.storage.save_meal(make_meal(f"m{i}", f"2025-10-2{i}T12:00:00"))
+
+        self.storage.compact()
+
+        self.assertEqual(self.storage.log_file.read_bytes(), b"")
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m0", "m1", "m2"])
+
+    def test_compact_runs_when_log_exceeds_threshold(self):
+        self.storage.COMPACT_THRESHOLD = 1
+        self.storage.save_meal(make_meal("m0"))
+
+        self.assertEqual(self.storage.log_file.read_bytes(), b"")
+        self.assertEqual(self.reload().get_total_count(), 1)
+
+    def test_torn_last_line_is_skipped_and_truncated_on_next_save(self):
+        self.storage.save_meal(make_meal("m0", "2025-10-20T12:00:00"))
+        with open(self.storage.log_file, 'ab') as f:
+            f.write(b'{"id": "m1", "datet')
+
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m0"])
+
+        self.assertTrue(self.storage.save_meal(make_meal("m2", "2025-10-22T12:00:00")))
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m0", "m2"])
+
+    def test_complete_last_line_without_newline_is_kept_on_next_save(self):
+        self.storage.save_meal(make_meal("m0", "2025-10-20T12:00:00"))
+        self.storage.log_file.write_bytes(self.storage.log_file.read_bytes().rstrip(b"\n"))
+
+        self.assertTrue(self.reload().save_meal(make_meal("m1", "2025-10-21T12:00:00")))
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m0", "m1"])
+
+    def test_corrupt_line_before_the_last_is_an_error(self):
+        self.storage.log_file.write_bytes(b'{"id": "m1", "datet\n{}\n')
+
+        with self.assertRaises(ValueError):
+            self.reload().load_all_meals()
+
+    def test_invalid_record_in_log_is_not_dropped(self):
+        self.storage.save_meal(make_meal("m0"))
+        with open(self.storage.log_file, 'ab') as f:
+            f.write(b'{"id": "m1", "datetime": "2025/10/28 12:00", "meal_type": "lunch", '
+                    b'"menu_items": [], "categories": [], "tags": []}\n')
+
+        with self.assertRaises(ValueError):
+            self.reload().load_all_meals()
+
+    def test_corrupt_json_is_an_error_and_is_not_overwritten(self):
+        self.data_file.write_text('[{"id": "m0", "dat', encoding='utf-8')
+        storage = self.reload()
+        storage.COMPACT_THRESHOLD = 1
+
+        with self.assertRaises(ValueError):
+            storage.load_all_meals()
+        self.assertTrue(storage.save_meal(make_meal("m1")))
+        self.assertFalse(storage.delete_meal("m1"))
+        self.assertEqual(self.data_file.read_text(encoding='utf-8'), '[{"id": "m0", "dat')
+
+    def test_records_in_both_files_are_not_duplicated(self):
+        self.storage.save_meal(make_meal("m0"))
+        log = self.storage.log_file.read_bytes()
+        self.storage.compact()
+        # meals.json の書き込み後、追記ファイルを空にする前に中断された状態を再現
+        self.storage.log_file.write_bytes(log)
+
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m0"])
+
+    def test_update_meal_with_changed_datetime_reorders_cache(self):
+        self.storage.save_meal(make_meal("m0", "2025-10-20T12:00:00"))
+        self.storage.save_meal(make_meal("m1", "2025-10-21T12:00:00"))
+
+        meal = self.storage.get_meal_by_id("m1")
+        meal.datetime = "2000-01-01T00:00:00"
+        self.assertTrue(self.storage.update_meal(meal))
+
+        self.assertEqual(self.storage.load_all_meals()[0]._dt.year, 2000)
+        self.assertEqual([m.id for m in self.storage.load_all_meals()], ["m1", "m0"])
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m1", "m0"])
+
+    def test_unsaved_edits_do_not_leak_into_cache(self):
+        meal = make_meal("m0")
+        self.storage.save_meal(meal)
+        meal.notes = "保存前の変更"
+        self.storage.get_meal_by_id("m0").notes = "保存前の変更"
+        self.storage.get_recent_meals()[0].menu_items.append("保存前の変更")
+
+        self.storage.compact()
+
+        stored = self.reload().get_meal_by_id("m0")
+        self.assertIsNone(stored.notes)
+        self.assertEqual(stored.menu_items, ["ご飯", "味噌汁"])
+
+    def test_delete_meal(self):
+        self.storage.save_meal(make_meal("m0"))
+        self.storage.save_meal(make_meal("m1"))
+
+        self.assertTrue(self.storage.delete_meal("m0"))
+
+        self.assertIsNone(self.storage.get_meal_by_id("m0"))
+        self.assertEqual([m.id for m in self.reload().load_all_meals()], ["m1"])
+
+    def test_mixed_naive_and_aware_datetimes(self):
+        self.storage.save_meal(make_meal("m0", "2025-10-28T12:00:00+09:00"))
+        self.assertTrue(self.storage.save_meal(make_meal("m1", "2025-10-27T12:00:00")))
+
+        self.assertEqual([m.id for m in self.reload().get_recent_meals()], ["m0", "m1"])
+
+    @unittest.skipIf(storage.ijson is None, "ijson がインストールされていない")
+    def test_streaming_read_raises_on_invalid_record(self):
+        for i in range(3):
+            self.storage.save_meal(make_meal(f"m{i}", f"2025-10-2{i}T12:00:00"))
+        self.storage.compact()
+        self.data_file.write_text(
+            self.data_file.read_text(encoding='utf-8').replace("2025-10-21T12:00:00", "2025/10/21"),
+            encoding='utf-8'
+        )
+
+        reloaded = self.reload()
+        reloaded.STREAMING_THRESHOLD = 1
+        with self.assertRaises(ValueError):
+            reloaded.load_all_meals()
+
+    @unittest.skipIf(storage.ijson is None, "ijson がインストールされていない")
+    def test_streaming_read_raises_on_corrupt_json(self):
+        self.data_file.write_text('[{"id": "m0", "dat', encoding='utf-8')
+
+        reloaded = self.reload()
+        reloaded.STREAMING_THRESHOLD = 1
+        with self.assertRaises(ValueError):
+            reloaded.load_all_meals()
+
+
+if __name__ == "__main__":
+    unittest.main()